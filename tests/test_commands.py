@@ -0,0 +1,107 @@
+import os
+
+import pytest
+import yaml
+
+import vism.commands
+from vism.commands import CommandManager
+from vism.manifest import ManifestError
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(vism.commands, "EgetWrapper", lambda: None)
+    return CommandManager()
+
+
+def write_manifest(manager, name, data):
+    with open(manager.paths.manifests_dir / f"{name}.yml", "w") as f:
+        yaml.safe_dump(data, f)
+
+
+def install_fake_app(manager, name):
+    app_dir = manager.paths.get_app_dir(name)
+    app_dir.mkdir(parents=True)
+    binary = app_dir / name
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    link = manager.paths.get_bin_path(name)
+    os.symlink(binary, link)
+    return app_dir, link
+
+
+def test_remove_legacy_manifest_without_symlink_path(manager):
+    app_dir, link = install_fake_app(manager, "app")
+    write_manifest(manager, "app", {"repo": "user/app", "installed_at": "2025-01-01T10:00:00"})
+
+    manager.remove("app")
+
+    assert not link.is_symlink()
+    assert not app_dir.exists()
+    assert manager.config.load_manifest("app") is None
+
+
+def test_remove_keeps_foreign_symlink(manager, tmp_path):
+    other = tmp_path / "other"
+    other.write_text("")
+    link = manager.paths.get_bin_path("app")
+    os.symlink(other, link)
+    write_manifest(manager, "app", {"repo": "user/app"})
+
+    manager.remove("app")
+
+    assert link.is_symlink()
+
+
+@pytest.mark.parametrize("content", ["version: '1.0'\n", "repo: [unclosed\n"])
+def test_remove_damaged_manifest(manager, content):
+    app_dir, link = install_fake_app(manager, "broken")
+    (manager.paths.manifests_dir / "broken.yml").write_text(content)
+
+    manager.remove("broken")
+
+    assert not link.is_symlink()
+    assert not app_dir.exists()
+    assert manager.config.load_manifest("broken") is None
+
+
+def test_list_does_not_rewrite_legacy_manifest(manager, capsys):
+    write_manifest(manager, "app", {"repo": "user/app"})
+
+    manager.list()
+
+    assert "schema_version" not in manager.config.load_manifest("app")
+    assert "user/app" in capsys.readouterr().out
+
+
+def test_list_reports_no_matches(manager, capsys):
+    write_manifest(manager, "app", {"repo": "user/app"})
+
+    manager.list(repo="other/*")
+
+    assert "No matching apps." in capsys.readouterr().out
+
+
+def test_info_corrupt_manifest(manager):
+    (manager.paths.manifests_dir / "bad.yml").write_text("repo: [unclosed\n")
+
+    with pytest.raises(ManifestError):
+        manager.info("bad")
+
+
+def test_list_skips_corrupt_manifest(manager, capsys):
+    write_manifest(manager, "app", {"repo": "user/app"})
+    (manager.paths.manifests_dir / "bad.yml").write_text("repo: [unclosed\n")
+
+    manager.list()
+
+    captured = capsys.readouterr()
+    assert "user/app" in captured.out
+    assert "bad.yml" in captured.err
+
+
+def test_unquoted_float_version_keeps_text(manager):
+    (manager.paths.manifests_dir / "app.yml").write_text("repo: user/app\nversion: 1.10\n")
+
+    assert manager.config.load("app").version == "1.10"
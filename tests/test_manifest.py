@@ -0,0 +1,102 @@
+import time
+from datetime import date, datetime
+
+import pytest
+
+from vism.manifest import SCHEMA_VERSION, Manifest, ManifestError, migrate, query
+
+
+@pytest.fixture
+def utc(monkeypatch):
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def make(name, repo="user/repo", version="1.0", installed_at=None):
+    return Manifest(name=name, repo=repo, version=version, installed_at=installed_at)
+
+
+def test_migrate_v0_fills_defaults():
+    data = migrate({"repo": "user/repo", "installed_at": "2025-01-01T10:00:00"})
+    assert data["schema_version"] == SCHEMA_VERSION
+    assert data["version"] == "unknown"
+    assert data["files"] == []
+
+
+def test_migrate_rejects_future_version():
+    with pytest.raises(ManifestError):
+        migrate({"repo": "user/repo", "schema_version": SCHEMA_VERSION + 1})
+
+
+def test_from_dict_v0():
+    manifest = Manifest.from_dict("app", {"repo": "user/repo", "installed_at": "2025-01-01T10:00:00"})
+    assert manifest.name == "app"
+    assert manifest.installed_at == datetime(2025, 1, 1, 10, 0)
+    assert manifest.symlink_path is None
+    assert manifest.schema_version == SCHEMA_VERSION
+
+
+def test_from_dict_missing_repo():
+    with pytest.raises(ManifestError):
+        Manifest.from_dict("app", {"version": "1.0"})
+
+
+def test_from_dict_aware_timestamp_is_naive():
+    manifest = Manifest.from_dict("app", {"repo": "user/repo", "installed_at": "2024-03-01T10:00:00+00:00"})
+    assert manifest.installed_at.tzinfo is None
+
+
+def test_from_dict_rejects_non_list_files():
+    with pytest.raises(ManifestError):
+        Manifest.from_dict("app", {"repo": "user/repo", "files": "abc"})
+
+
+def test_from_dict_warns_on_float_version(capsys):
+    manifest = Manifest.from_dict("app", {"repo": "user/repo", "version": 1.1})
+    assert manifest.version == "1.1"
+    assert "quote it" in capsys.readouterr().err
+
+
+def test_to_dict_roundtrip():
+    manifest = Manifest("app", "user/repo", "2.0", datetime(2025, 1, 1), tag="v2", symlink_path="/bin/app")
+    loaded = Manifest.from_dict("app", manifest.to_dict())
+    assert loaded.to_json() == manifest.to_json()
+
+
+def test_query_filters_repo_wildcard_and_version():
+    apps = [make("a", repo="zen-browser/desktop"), make("b", repo="foo/bar", version="2.0")]
+    assert [m.name for m in query(apps, repo="zen-browser/*")] == ["a"]
+    assert [m.name for m in query(apps, version="2.*")] == ["b"]
+
+
+def test_query_sorts_versions_naturally():
+    apps = [make("a", version="1.10"), make("b", version="1.9"), make("c", version="v1.2")]
+    assert [m.version for m in query(apps, sort_by="version")] == ["v1.2", "1.9", "1.10"]
+
+
+def test_query_until_date_is_inclusive():
+    apps = [
+        make("a", installed_at=datetime(2025, 3, 1, 23, 30)),
+        make("b", installed_at=datetime(2025, 3, 2, 0, 0)),
+        make("c"),
+    ]
+    assert [m.name for m in query(apps, until="2025-03-01")] == ["a"]
+    assert [m.name for m in query(apps, until=date(2025, 3, 1))] == ["a"]
+    assert [m.name for m in query(apps, since="2025-03-02")] == ["b"]
+
+
+def test_query_mixed_timezones(utc):
+    apps = [
+        make("a", installed_at=datetime(2025, 1, 1, 12, 0)),
+        Manifest.from_dict("b", {"repo": "user/repo", "installed_at": "2024-03-01T10:00:00+00:00"}),
+    ]
+    assert [m.name for m in query(apps, sort_by="installed_at")] == ["b", "a"]
+    assert [m.name for m in query(apps, since="2025-01-01T00:00+00:00")] == ["a"]
+
+
+def test_query_rejects_unknown_sort_key():
+    with pytest.raises(ValueError):
+        list(query([], sort_by="size"))
@@ -1,12 +1,14 @@
 import os
 import sys
+import json
 import shutil
 from datetime import date
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from vism.config import ConfigManager
+from vism.manifest import Manifest, ManifestError, query
 from vism.paths import PathManager
 from vism.eget import EgetWrapper
 from vism.desktop import DesktopIntegrator
@@ -164,30 +166,43 @@ class CommandManager:
 
         # 7. Save Manifest
         
-        manifest_data = {
-            "repo": repo_url,
-            "installed_at": datetime.now().isoformat(),
-            "files": [], # TODO: Track installed files
-            "version": metadata.get("version", "unknown")
-        }
-        if tag:
-            manifest_data["tag"] = tag
-            
-        self.config.save_manifest(app_name, manifest_data)
+        manifest = Manifest(
+            name=app_name,
+            repo=repo_url,
+            version=metadata.get("version", "unknown"),
+            installed_at=datetime.now(),
+            tag=tag,
+            symlink_path=str(symlink_path) if symlink_path else None,
+            files=[], # TODO: Track installed files
+        )
+        self.config.save(manifest)
         print(f"Successfully installed {app_name}!")
         if "version" in metadata:
             print(f"Detected version: {metadata['version']}")
 
     def remove(self, app_name: str) -> None:
-        manifest = self.config.load_manifest(app_name)
-        if not manifest:
-            print(f"App '{app_name}' not found.")
-            return
+        try:
+            manifest = self.config.load(app_name)
+        except ManifestError as e:
+            # A damaged manifest must not block uninstalling; clean up the default locations.
+            print(f"Warning: {e}. Removing default install locations.")
+            symlink_path = None
+        else:
+            if not manifest:
+                print(f"App '{app_name}' not found.")
+                return
+            symlink_path = manifest.symlink_path
 
         print(f"Uninstalling {app_name}...")
 
         # 1. Remove symlink
-        symlink_path = manifest.get("symlink_path")
+        if not symlink_path:
+            # Older manifests did not record the symlink. Only remove the default
+            # one if it points into our app dir, so we don't delete someone else's.
+            default_link = self.paths.get_bin_path(app_name)
+            app_dir = self.paths.get_app_dir(app_name).resolve()
+            if default_link.is_symlink() and default_link.resolve().is_relative_to(app_dir):
+                symlink_path = str(default_link)
         if symlink_path:
             p = Path(symlink_path)
             if p.exists() or p.is_symlink():
@@ -218,15 +233,58 @@ class CommandManager:
         self.config.delete_manifest(app_name)
         print(f"Uninstalled {app_name}.")
 
-    def list(self) -> None:
-        apps = self.config.list_apps()
-        if not apps:
-            print("No apps installed.")
+    def query(self, repo: Optional[str] = None, version: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              sort_by: Optional[str] = None, reverse: bool = False) -> Iterator[Manifest]:
+        """
+        Yields installed app manifests matching the given filters.
+        See vism.manifest.query for the filter semantics.
+        """
+        return query(self.config.iter_manifests(), repo=repo, version=version,
+                     since=since, until=until, sort_by=sort_by, reverse=reverse)
+
+    def list(self, as_json: bool = False, **filters) -> None:
+        apps = self.query(**filters)
+
+        if as_json:
+            # One JSON object per line (NDJSON), flushed as we go so consumers
+            # can start processing before all manifests are read.
+            for app in apps:
+                print(json.dumps(app.to_json()), flush=True)
             return
 
-        print(f"{'Name':<20} {'Repo':<40} {'Version':<15} {'Installed':<15}")
-        print("-" * 90)
+        header_printed = False
         for app in apps:
-            installed_date = app.get('installed_at', '')[:10]
-            version = app.get('version', '')
-            print(f"{app['name']:<20} {app['repo']:<40} {version:<15} {installed_date:<15}")
+            if not header_printed:
+                print(f"{'Name':<20} {'Repo':<40} {'Version':<15} {'Installed':<15}")
+                print("-" * 90)
+                header_printed = True
+            installed_date = app.installed_at.date().isoformat() if app.installed_at else ''
+            print(f"{app.name:<20} {app.repo:<40} {app.version:<15} {installed_date:<15}")
+
+        if not header_printed:
+            if any(filters.get(k) for k in ("repo", "version", "since", "until")):
+                print("No matching apps.")
+            else:
+                print("No apps installed.")
+
+    def info(self, app_name: str, as_json: bool = False) -> bool:
+        manifest = self.config.load(app_name)
+        if not manifest:
+            print(f"App '{app_name}' not found.", file=sys.stderr)
+            return False
+
+        if as_json:
+            print(json.dumps(manifest.to_json()))
+            return True
+
+        installed_at = manifest.installed_at.isoformat(sep=" ", timespec="seconds") if manifest.installed_at else "unknown"
+        print(f"Name:       {manifest.name}")
+        print(f"Repo:       {manifest.repo}")
+        print(f"Version:    {manifest.version}")
+        if manifest.tag:
+            print(f"Tag:        {manifest.tag}")
+        print(f"Installed:  {installed_at}")
+        print(f"Symlink:    {manifest.symlink_path or 'none'}")
+        print(f"Directory:  {self.paths.get_app_dir(app_name)}")
+        return True
@@ -1,6 +1,20 @@
 import os
+import sys
 import yaml
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, Optional
+
+from vism.manifest import Manifest, ManifestError
+
+class _ManifestLoader(yaml.SafeLoader):
+    """
+    SafeLoader that keeps floats as their scalar text, so an unquoted
+    `version: 1.10` is read as "1.10" instead of 1.1.
+    """
+
+
+_ManifestLoader.add_constructor("tag:yaml.org,2002:float",
+                                lambda loader, node: loader.construct_scalar(node))
+
 
 class ConfigManager:
     """
@@ -26,7 +40,7 @@ class ConfigManager:
         if not os.path.exists(path):
             return None
         with open(path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_ManifestLoader)
 
     def delete_manifest(self, app_name: str) -> None:
         """Deletes the manifest for an app."""
@@ -34,22 +48,38 @@ class ConfigManager:
         if os.path.exists(path):
             os.remove(path)
 
-    def list_apps(self) -> List[Dict]:
-        """Lists all installed apps and their manifests."""
-        apps = []
+    def load(self, app_name: str) -> Optional[Manifest]:
+        """
+        Loads the typed manifest for an app. Returns None if not found.
+        Manifests written with an older schema are migrated in memory;
+        they are upgraded on disk the next time the app is saved.
+        """
+        try:
+            data = self.load_manifest(app_name)
+        except (OSError, yaml.YAMLError) as e:
+            raise ManifestError(f"Cannot read manifest for '{app_name}': {e}") from e
+        if data is None:
+            return None
+        return Manifest.from_dict(app_name, data)
+
+    def save(self, manifest: Manifest) -> None:
+        """Saves a typed manifest."""
+        self.save_manifest(manifest.name, manifest.to_dict())
+
+    def iter_manifests(self) -> Iterator[Manifest]:
+        """
+        Yields the typed manifest of every installed app, ordered by name.
+        Each file is read once, as it is reached.
+        """
         if not os.path.exists(self.manifests_dir):
-            return apps
-            
-        for filename in os.listdir(self.manifests_dir):
+            return
+
+        for filename in sorted(os.listdir(self.manifests_dir)):
             if filename.endswith(".yml"):
-                path = os.path.join(self.manifests_dir, filename)
                 try:
-                    with open(path, 'r') as f:
-                        data = yaml.safe_load(f)
-                        if data:
-                            data['name'] = filename[:-4]
-                            apps.append(data)
-                except Exception as e:
-                    print(f"Error loading {filename}: {e}")
-        return apps
-
+                    manifest = self.load(filename[:-4])
+                except ManifestError as e:
+                    print(f"Error loading {filename}: {e}", file=sys.stderr)
+                    continue
+                if manifest:
+                    yield manifest
@@ -0,0 +1,220 @@
+import fnmatch
+import re
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Version of the on-disk manifest layout written by this release.
+# Manifests without a "schema_version" key predate versioning and are
+# treated as version 0.
+SCHEMA_VERSION = 1
+
+SORT_KEYS = ("name", "repo", "version", "installed_at")
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest cannot be parsed or migrated."""
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parses a datetime, date or ISO string into a naive local datetime.
+    Aware values are converted to local time so they compare cleanly
+    with the naive timestamps written by install.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError as e:
+            raise ManifestError(f"Invalid date: {value!r}") from e
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _is_bare_date(value: Any) -> bool:
+    """True if value names a whole day rather than a point in time."""
+    if isinstance(value, datetime):
+        return False
+    if isinstance(value, date):
+        return True
+    return isinstance(value, str) and "T" not in value and " " not in value.strip()
+
+
+def _migrate_v0(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Version 0 manifests were written as loose dicts: "version" may be
+    missing and the binary symlink was never recorded, so "symlink_path"
+    is left unset for the caller to resolve.
+    """
+    data = dict(data)
+    data.setdefault("version", "unknown")
+    data.setdefault("files", [])
+    data["schema_version"] = 1
+    return data
+
+
+# Maps a schema version to the function upgrading it to the next version.
+_MIGRATIONS = {
+    0: _migrate_v0,
+}
+
+
+def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Upgrades raw manifest data to SCHEMA_VERSION, one step at a time.
+    """
+    version = data.get("schema_version", 0)
+    if not isinstance(version, int) or version > SCHEMA_VERSION:
+        raise ManifestError(f"Unsupported manifest schema version: {version!r}")
+    while version < SCHEMA_VERSION:
+        data = _MIGRATIONS[version](data)
+        version = data["schema_version"]
+    return data
+
+
+class Manifest:
+    """
+    Typed view of an installed app's manifest.
+    """
+    __slots__ = ("name", "repo", "version", "installed_at", "tag",
+                 "symlink_path", "files", "schema_version")
+
+    def __init__(self, name: str, repo: str, version: str = "unknown",
+                 installed_at: Optional[datetime] = None, tag: Optional[str] = None,
+                 symlink_path: Optional[str] = None, files: Optional[List[str]] = None,
+                 schema_version: int = SCHEMA_VERSION):
+        self.name = name
+        self.repo = repo
+        self.version = version
+        self.installed_at = installed_at
+        self.tag = tag
+        self.symlink_path = symlink_path
+        self.files = files if files is not None else []
+        self.schema_version = schema_version
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "Manifest":
+        """
+        Builds a Manifest from raw YAML data, migrating older schemas.
+        """
+        if not isinstance(data, dict):
+            raise ManifestError(f"Manifest for '{name}' is not a mapping")
+        data = migrate(data)
+        if not data.get("repo"):
+            raise ManifestError(f"Manifest for '{name}' has no repo")
+        files = data.get("files")
+        if files is None:
+            files = []
+        elif not isinstance(files, list):
+            raise ManifestError(f"Manifest for '{name}' has invalid files: {files!r}")
+        version = data.get("version") or "unknown"
+        if isinstance(version, float):
+            print(f"Warning: version of '{name}' was read as the number {version!r}; "
+                  "quote it in the manifest to keep its exact text.", file=sys.stderr)
+        symlink_path = data.get("symlink_path")
+        tag = data.get("tag")
+        return cls(
+            name=name,
+            repo=str(data["repo"]),
+            version=str(version),
+            installed_at=_parse_datetime(data.get("installed_at")),
+            tag=str(tag) if tag is not None else None,
+            symlink_path=str(symlink_path) if symlink_path else None,
+            files=[str(f) for f in files],
+            schema_version=data["schema_version"],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the data as written to the manifest YAML file.
+        The name is not stored; it is derived from the file name.
+        """
+        data = {
+            "schema_version": self.schema_version,
+            "repo": self.repo,
+            "version": self.version,
+            "installed_at": self.installed_at.isoformat() if self.installed_at else None,
+            "files": list(self.files),
+        }
+        if self.tag:
+            data["tag"] = self.tag
+        if self.symlink_path:
+            data["symlink_path"] = self.symlink_path
+        return data
+
+    def to_json(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable dict including the app name."""
+        data = {"name": self.name}
+        data.update(self.to_dict())
+        data.setdefault("tag", None)
+        data.setdefault("symlink_path", None)
+        return data
+
+    def __repr__(self) -> str:
+        return f"Manifest(name={self.name!r}, repo={self.repo!r}, version={self.version!r})"
+
+
+def _version_key(version: str) -> List[Any]:
+    # Natural ordering so that "1.10" sorts after "1.9".
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in re.split(r"(\d+)", version.lstrip("vV")) if part]
+
+
+def _sort_key(field: str):
+    if field == "version":
+        return lambda m: _version_key(m.version)
+    if field == "installed_at":
+        return lambda m: m.installed_at or datetime.min
+    return lambda m: getattr(m, field).lower()
+
+
+def query(manifests: Iterable[Manifest], repo: Optional[str] = None,
+          version: Optional[str] = None, since: Any = None, until: Any = None,
+          sort_by: Optional[str] = None, reverse: bool = False) -> Iterator[Manifest]:
+    """
+    Filters and sorts manifests.
+
+    `repo` and `version` accept shell-style wildcards (e.g. "zen-browser/*").
+    `since` and `until` bound the install date inclusively and accept
+    datetimes, dates or ISO strings. Without `sort_by` the input order is
+    kept and results are yielded lazily.
+    """
+    if sort_by is not None and sort_by not in SORT_KEYS:
+        raise ValueError(f"Cannot sort by '{sort_by}', expected one of {', '.join(SORT_KEYS)}")
+    since_dt = _parse_datetime(since)
+    until_dt = _parse_datetime(until)
+    until_inclusive = True
+    # A bare date as upper bound covers the whole day.
+    if until_dt is not None and _is_bare_date(until):
+        until_dt += timedelta(days=1)
+        until_inclusive = False
+
+    def matches(m: Manifest) -> bool:
+        if repo is not None and not fnmatch.fnmatchcase(m.repo, repo):
+            return False
+        if version is not None and not fnmatch.fnmatchcase(m.version, version):
+            return False
+        if since_dt is not None and (m.installed_at is None or m.installed_at < since_dt):
+            return False
+        if until_dt is not None:
+            if m.installed_at is None:
+                return False
+            if m.installed_at > until_dt or (not until_inclusive and m.installed_at == until_dt):
+                return False
+        return True
+
+    results = (m for m in manifests if matches(m))
+    if sort_by is None:
+        if reverse:
+            yield from reversed(list(results))
+        else:
+            yield from results
+        return
+    yield from sorted(results, key=_sort_key(sort_by), reverse=reverse)